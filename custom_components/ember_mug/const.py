@@ -5,6 +5,7 @@ Most of these are UUIDs.
 Since these are not public some were found on this repo https://github.com/orlopau/ember-mug/ (Thank you!)
 Some found from testing and from the App.
 """
+import re
 from uuid import UUID
 
 DOMAIN = "ember_mug"
@@ -91,11 +92,13 @@ PUSH_EVENT_ID_LIQUID_LEVEL_CHANGED = 7
 PUSH_EVENT_ID_LIQUID_STATE_CHANGED = 8
 PUSH_EVENT_ID_BATTERY_VOLTAGE_STATE_CHANGED = 9
 
-PUSH_EVENT_BATTERY_IDS = [
-    PUSH_EVENT_ID_BATTERY_CHANGED,
-    PUSH_EVENT_ID_CHARGER_CONNECTED,
-    PUSH_EVENT_ID_CHARGER_DISCONNECTED,
-]
+PUSH_EVENT_BATTERY_IDS = frozenset(
+    {
+        PUSH_EVENT_ID_BATTERY_CHANGED,
+        PUSH_EVENT_ID_CHARGER_CONNECTED,
+        PUSH_EVENT_ID_CHARGER_DISCONNECTED,
+    }
+)
 
 # To gather bytes from mug for stats (Notify)
 UUID_STATISTICS = UUID("fc540013-236c-4c94-8fa9-944a3e5353fa")
@@ -129,4 +132,5 @@ UUID_ACCELERATION = UUID("fc54000b-236c-4c94-8fa9-944a3e5353fa")
 
 # Validation
 MUG_NAME_REGEX = r"[A-Za-z0-9,.\[\]#()!\"\';:|\-_+<>%= ]{1,16}"
+MUG_NAME_PATTERN = re.compile(MUG_NAME_REGEX)
 MAC_ADDRESS_REGEX = r"^([0-9A-Fa-f]{2}:){5}([0-9A-Fa-f]{2})$"
@@ -2,23 +2,32 @@
 
 import asyncio
 import base64
+from collections import deque
 import contextlib
-import re
-from typing import Callable, Tuple, Union
+import struct
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple, Union
+from uuid import UUID
 
 from bleak import BleakClient
+from bleak.backends.characteristic import BleakGATTCharacteristic
 from bleak.exc import BleakError
-from homeassistant.const import TEMP_CELSIUS, TEMP_FAHRENHEIT
+from homeassistant.const import (
+    ATTR_BATTERY_LEVEL,
+    CONF_TEMPERATURE_UNIT,
+    TEMP_CELSIUS,
+    TEMP_FAHRENHEIT,
+)
 from homeassistant.helpers.typing import HomeAssistantType
 
 from . import _LOGGER
 from .const import (
     LIQUID_STATE_LABELS,
+    MUG_NAME_PATTERN,
     PUSH_EVENT_BATTERY_IDS,
     PUSH_EVENT_ID_AUTH_INFO_NOT_FOUND,
+    PUSH_EVENT_ID_BATTERY_CHANGED,
     PUSH_EVENT_ID_BATTERY_VOLTAGE_STATE_CHANGED,
     PUSH_EVENT_ID_CHARGER_CONNECTED,
-    PUSH_EVENT_ID_CHARGER_DISCONNECTED,
     PUSH_EVENT_ID_DRINK_TEMPERATURE_CHANGED,
     PUSH_EVENT_ID_LIQUID_LEVEL_CHANGED,
     PUSH_EVENT_ID_LIQUID_STATE_CHANGED,
@@ -40,25 +49,117 @@ from .const import (
     UUID_UDSK,
 )
 
+# Seconds between full updates. Push events trigger reads in between
+FULL_UPDATE_INTERVAL = 5 * 60
+
+# Connection retry backoff in seconds
+CONNECT_RETRY_DELAY = 1
+CONNECT_RETRY_MAX_DELAY = 5 * 60
+
+# Attributes read on every full update
+UPDATE_ATTRS = (
+    "led_colour",
+    "current_temp",
+    "target_temp",
+    "temperature_unit",
+    "battery",
+    "liquid_level",
+    "liquid_state",
+    "mug_name",
+    "udsk",
+    "dsk",
+    "date_time_zone",
+    "battery_voltage",
+    "firmware_info",
+)
+
+# Attributes fixed for the mug that don't need to be read again once known
+STATIC_ATTRS = frozenset({"dsk", "firmware_info"})
+
+# Push event ID -> attribute to refresh (battery events are handled separately)
+PUSH_EVENT_ATTRIBUTES = {
+    PUSH_EVENT_ID_TARGET_TEMPERATURE_CHANGED: "target_temp",
+    PUSH_EVENT_ID_DRINK_TEMPERATURE_CHANGED: "current_temp",
+    PUSH_EVENT_ID_LIQUID_LEVEL_CHANGED: "liquid_level",
+    PUSH_EVENT_ID_LIQUID_STATE_CHANGED: "liquid_state",
+    PUSH_EVENT_ID_BATTERY_VOLTAGE_STATE_CHANGED: "battery_voltage",
+}
+
+# Characteristics resolved once per connection, keyed by bleak's lowercase UUID string
+CHARACTERISTIC_UUIDS = {
+    str(uuid): uuid
+    for uuid in (
+        UUID_BATTERY,
+        UUID_CONTROL_REGISTER_DATA,
+        UUID_DRINK_TEMPERATURE,
+        UUID_DSK,
+        UUID_LED,
+        UUID_LIQUID_LEVEL,
+        UUID_LIQUID_STATE,
+        UUID_MUG_ID,
+        UUID_MUG_NAME,
+        UUID_OTA,
+        UUID_PUSH_EVENT,
+        UUID_TARGET_TEMPERATURE,
+        UUID_TEMPERATURE_UNIT,
+        UUID_TIME_DATE_AND_ZONE,
+        UUID_UDSK,
+    )
+}
+
 
 def decode_byte_string(data: Union[bytes, bytearray]) -> str:
     """Convert bytes to text as Ember expects."""
-    return re.sub("(\\r|\\n)", "", base64.encodebytes(data + b"===").decode("utf8"))
+    return base64.b64encode(data + b"===").decode("ascii")
 
 
-def bytes_to_little_int(data: bytearray) -> int:
-    """Convert bytes to little int."""
-    return int.from_bytes(data, byteorder="little", signed=False)
+def _celsius_from_raw(raw: int) -> float:
+    """Convert raw mug temperature to celsius."""
+    return round(raw * 0.01, 2)
 
 
-def bytes_to_big_int(data: bytearray) -> int:
-    """Convert bytes to big int."""
-    return int.from_bytes(data, "big")
+def _fahrenheit_from_raw(raw: int) -> float:
+    """Convert raw mug temperature to fahrenheit."""
+    return round(raw * 0.018 + 32, 2)
 
 
 class EmberMug:
     """Class to connect and communicate with the mug via Bluetooth."""
 
+    __slots__ = (
+        "_attributes",
+        "_characteristics",
+        "_loop",
+        "_raw_values",
+        "_temp_from_raw",
+        "_update_methods",
+        "_updates_event",
+        "async_update_callback",
+        "available",
+        "battery",
+        "battery_voltage",
+        "client",
+        "current_temp",
+        "date_time_zone",
+        "dsk",
+        "firmware_info",
+        "hass",
+        "latest_event_id",
+        "led_colour_rgba",
+        "liquid_level",
+        "liquid_state",
+        "mac_address",
+        "mug_id",
+        "mug_name",
+        "on_charging_base",
+        "serial_number",
+        "target_temp",
+        "temperature_unit",
+        "udsk",
+        "updates_queued",
+        "use_metric",
+    )
+
     def __init__(
         self,
         mac_address: str,
@@ -68,14 +169,25 @@ class EmberMug:
     ) -> None:
         """Set default values in for mug attributes."""
         self._loop = False
-        self._first_run = True
         self.hass = hass
         self.async_update_callback = async_update_callback
         self.mac_address = mac_address
         self.client = BleakClient(mac_address)
+        self._characteristics: Dict[UUID, BleakGATTCharacteristic] = {}
+        self._attributes: Optional[Dict[str, Any]] = None
+        self._raw_values: Dict[UUID, bytearray] = {}
+        self._update_methods: Dict[str, Callable[[], Awaitable[None]]] = {
+            attr: getattr(self, f"update_{attr}") for attr in UPDATE_ATTRS
+        }
         self.available = True
-        self.updates_queued = set()
+        # Filled by push notifications, drained by `update_queued_attributes`
+        self.updates_queued: Deque[str] = deque()
+        self._updates_event = asyncio.Event()
         self.use_metric = use_metric
+        # Raw temperatures are in 0.01°C. Pick the conversion once.
+        self._temp_from_raw: Callable[[int], float] = (
+            _celsius_from_raw if use_metric else _fahrenheit_from_raw
+        )
 
         self.led_colour_rgba = [255, 255, 255, 255]
         self.latest_event_id: int = None
@@ -101,19 +213,43 @@ class EmberMug:
     @property
     def colour(self) -> str:
         """Return colour as hex value."""
-        r, g, b, a = self.led_colour_rgba
-        return f"#{r:02x}{g:02x}{b:02x}{a:02x}"
+        return f"#{bytes(self.led_colour_rgba).hex()}"
 
     @property
     def liquid_state_label(self) -> str:
         """Return human readable liquid state."""
         return LIQUID_STATE_LABELS[self.liquid_state or 0]
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Return mug attributes for HASS. Cached until an update changes them."""
+        if self._attributes is None:
+            self._attributes = {
+                ATTR_BATTERY_LEVEL: self.battery,
+                "led_colour": self.colour,
+                "current_temp": self.current_temp,
+                "target_temp": self.target_temp,
+                CONF_TEMPERATURE_UNIT: self.temperature_unit,
+                "latest_push": self.latest_event_id,
+                "serial_number": self.serial_number,
+                "on_charging_base": self.on_charging_base,
+                "liquid_level": self.liquid_level,
+                "liquid_state": self.liquid_state_label,
+                "liquid_state_label": self.liquid_state_label,
+                "date_time_zone": self.date_time_zone,
+                "battery_voltage": self.battery_voltage,
+                "firmware_info": self.firmware_info,
+                "udsk": self.udsk,
+                "dsk": self.dsk,
+                "mug_name": self.mug_name,
+                "mug_id": self.mug_id,
+            }
+        return self._attributes
+
     async def async_run(self) -> None:
         """Start a the task loop."""
         try:
             self._loop = True
-            _LOGGER.info(f"Starting mug loop {self.mac_address}")
+            _LOGGER.info("Starting mug loop %s", self.mac_address)
             await self.connect()
 
             while self._loop:
@@ -124,175 +260,238 @@ class EmberMug:
                 self.updates_queued.clear()
                 self.async_update_callback()
 
-                # Maintain connection for 5min seconds until next update
+                # Maintain connection for 5min until next full update
                 # We will be notified of most changes during this time
-                for _ in range(150):
-                    self.client.is_connected
-                    await self.update_queued_attributes()
-                    await asyncio.sleep(2)
+                await self.wait_for_notifications(FULL_UPDATE_INTERVAL)
 
         except Exception as e:
-            _LOGGER.error(f"An unexpected error occurred during loop {e}. Restarting.")
+            _LOGGER.error("An unexpected error occurred during loop %s. Restarting.", e)
             self.hass.async_create_task(self.async_run())
 
-    async def _temp_from_bytes(self, temp_bytes: bytearray) -> float:
+    async def wait_for_notifications(self, duration: float) -> None:
+        """Update queued attributes as push events arrive for `duration` seconds."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + duration
+        while self._loop:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                return
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._updates_event.wait(), timeout)
+            self._updates_event.clear()
+            await self.update_queued_attributes()
+
+    def _temp_from_bytes(self, temp_bytes: bytearray) -> float:
         """Get temperature from bytearray and convert to fahrenheit if needed."""
-        temp = float(bytes_to_little_int(temp_bytes)) * 0.01
-        if self.use_metric is False:
-            # Convert to fahrenheit
-            temp = (temp * 9 / 5) + 32
-        return round(temp, 2)
+        return self._temp_from_raw(int.from_bytes(temp_bytes, "little"))
 
     async def update_battery(self) -> None:
         """Get Battery percent from mug gatt."""
-        battery = await self.client.read_gatt_char(UUID_BATTERY)
+        battery = await self._read_changed(UUID_BATTERY)
+        if battery is None:
+            return
         battery_percent = float(battery[0])
-        _LOGGER.debug(f"Battery is at {battery_percent}. On base: {battery[1] == 1}")
+        _LOGGER.debug("Battery is at %s. On base: %s", battery_percent, battery[1] == 1)
         self.battery = round(battery_percent, 2)
         self.on_charging_base = battery[1] == 1
 
     async def update_led_colour(self) -> None:
         """Get RGBA colours from mug gatt."""
-        self.led_colour_rgba = list(await self.client.read_gatt_char(UUID_LED))
+        led_colour = await self._read_changed(UUID_LED)
+        if led_colour is not None:
+            self.led_colour_rgba = list(led_colour)
 
     async def set_led_colour(self, colour: Tuple[int, int, int, int]) -> None:
         """Set new target temp for mug."""
-        _LOGGER.debug(f"Set led colour to {colour}")
+        _LOGGER.debug("Set led colour to %s", colour)
         colour = bytearray(colour)  # To RGBA bytearray
         await self.client.pair()
-        await self.client.write_gatt_char(UUID_LED, colour, False)
+        await self._write(UUID_LED, colour)
 
     async def update_target_temp(self) -> None:
         """Get target temp form mug gatt."""
-        temp_bytes = await self.client.read_gatt_char(UUID_TARGET_TEMPERATURE)
-        target_temp = await self._temp_from_bytes(temp_bytes)
-        if self.target_temp != target_temp:
-            _LOGGER.debug(f"Target temp {self.target_temp}")
-            self.target_temp = target_temp
+        temp_bytes = await self._read_changed(UUID_TARGET_TEMPERATURE)
+        if temp_bytes is None:
+            return
+        self.target_temp = self._temp_from_bytes(temp_bytes)
+        _LOGGER.debug("Target temp %s", self.target_temp)
 
     async def set_target_temp(self, target_temp: float) -> None:
         """Set new target temp for mug."""
-        _LOGGER.debug(f"Set target temp to {target_temp}")
-        target = bytearray(int(target_temp / 0.01).to_bytes(2, "little"))
+        _LOGGER.debug("Set target temp to %s", target_temp)
+        target = struct.pack("<H", round(target_temp * 100))
         await self.client.pair()
-        await self.client.write_gatt_char(UUID_TARGET_TEMPERATURE, target, False)
+        await self._write(UUID_TARGET_TEMPERATURE, target)
 
     async def update_current_temp(self) -> None:
         """Get current temp from mug gatt."""
-        temp_bytes = await self.client.read_gatt_char(UUID_DRINK_TEMPERATURE)
-        current_temp = await self._temp_from_bytes(temp_bytes)
-        if self.current_temp != current_temp:
-            _LOGGER.debug(f"Current temp {self.current_temp}")
-            self.current_temp = current_temp
+        temp_bytes = await self._read_changed(UUID_DRINK_TEMPERATURE)
+        if temp_bytes is None:
+            return
+        self.current_temp = self._temp_from_bytes(temp_bytes)
+        _LOGGER.debug("Current temp %s", self.current_temp)
 
     async def update_liquid_level(self) -> None:
         """Get liquid level from mug gatt."""
-        liquid_level_bytes = await self.client.read_gatt_char(UUID_LIQUID_LEVEL)
-        liquid_level = bytes_to_little_int(liquid_level_bytes)
-        if self.liquid_level != liquid_level:
-            _LOGGER.debug(f"Liquid level now: {self.liquid_level}")
-            self.liquid_level = liquid_level
+        liquid_level_bytes = await self._read_changed(UUID_LIQUID_LEVEL)
+        if liquid_level_bytes is None:
+            return
+        self.liquid_level = int.from_bytes(liquid_level_bytes, "little")
+        _LOGGER.debug("Liquid level now: %s", self.liquid_level)
 
     async def update_liquid_state(self) -> None:
         """Get liquid state from mug gatt."""
-        liquid_state_bytes = await self.client.read_gatt_char(UUID_LIQUID_STATE)
-        self.liquid_state = bytes_to_little_int(liquid_state_bytes)
+        liquid_state_bytes = await self._read_changed(UUID_LIQUID_STATE)
+        if liquid_state_bytes is not None:
+            self.liquid_state = int.from_bytes(liquid_state_bytes, "little")
 
     async def update_mug_name(self) -> None:
         """Get mug name from gatt."""
-        name_bytes: bytearray = await self.client.read_gatt_char(UUID_MUG_NAME)
-        self.mug_name = bytes(name_bytes).decode("utf8")
+        name_bytes = await self._read_changed(UUID_MUG_NAME)
+        if name_bytes is not None:
+            self.mug_name = bytes(name_bytes).decode("utf8")
 
     async def set_mug_name(self, name: str) -> None:
         """Assign new name to mug."""
+        if not MUG_NAME_PATTERN.fullmatch(name):
+            raise ValueError(f"Invalid mug name: '{name}'")
         await self.client.pair()
-        await self.client.write_gatt_char(
-            UUID_MUG_NAME, bytearray(name.encode("utf8")), False
-        )
+        await self._write(UUID_MUG_NAME, bytearray(name.encode("utf8")))
 
     async def update_udsk(self) -> None:
         """Get mug udsk from gatt."""
-        self.udsk = decode_byte_string(await self.client.read_gatt_char(UUID_UDSK))
+        udsk = await self._read_changed(UUID_UDSK)
+        if udsk is not None:
+            self.udsk = decode_byte_string(udsk)
 
     async def update_dsk(self) -> None:
         """Get mug dsk from gatt."""
-        self.dsk = decode_byte_string(await self.client.read_gatt_char(UUID_DSK))
+        dsk = await self._read_changed(UUID_DSK)
+        if dsk is not None:
+            self.dsk = decode_byte_string(dsk)
 
     async def update_temperature_unit(self) -> None:
         """Get mug temp unit."""
-        unit_bytes = await self.client.read_gatt_char(UUID_TEMPERATURE_UNIT)
+        unit_bytes = await self._read_changed(UUID_TEMPERATURE_UNIT)
+        if unit_bytes is None:
+            return
         self.temperature_unit = (
-            TEMP_CELSIUS if bytes_to_little_int(unit_bytes) == 0 else TEMP_FAHRENHEIT
+            TEMP_CELSIUS
+            if int.from_bytes(unit_bytes, "little") == 0
+            else TEMP_FAHRENHEIT
         )
 
     async def update_battery_voltage(self) -> None:
         """Get voltage and charge time maybe."""
-        battery_voltage_bytes = await self.client.read_gatt_char(
-            UUID_CONTROL_REGISTER_DATA
-        )
-        self.battery_voltage = str(battery_voltage_bytes)
+        battery_voltage_bytes = await self._read_changed(UUID_CONTROL_REGISTER_DATA)
+        if battery_voltage_bytes is not None:
+            self.battery_voltage = battery_voltage_bytes.hex()
 
     async def update_date_time_zone(self) -> None:
         """Get date and time zone."""
-        self.date_time_zone = str(
-            await self.client.read_gatt_char(UUID_TIME_DATE_AND_ZONE)
-        )
+        date_time_zone_bytes = await self._read_changed(UUID_TIME_DATE_AND_ZONE)
+        if date_time_zone_bytes is not None:
+            self.date_time_zone = date_time_zone_bytes.hex()
 
     async def update_firmware_info(self) -> None:
         """Get firmware info."""
         # string getIntValue(18, 0) -> Firmware version
         # string getIntValue(18, 2) -> Hardware
         # string getIntValue(18, 4) -> Bootloader
-        self.firmware_info = str(await self.client.read_gatt_char(UUID_OTA))
+        firmware_info = await self._read_changed(UUID_OTA)
+        if firmware_info is not None:
+            self.firmware_info = {
+                "version": int.from_bytes(firmware_info[:2], "little"),
+                "hardware": int.from_bytes(firmware_info[2:4], "little"),
+                "bootloader": int.from_bytes(firmware_info[4:6], "little"),
+            }
+
+    def _cache_characteristics(self) -> None:
+        """Resolve the characteristics we use so bleak doesn't search for them on every call."""
+        self._characteristics = {}
+        for characteristic in self.client.services.characteristics.values():
+            uuid = CHARACTERISTIC_UUIDS.get(characteristic.uuid.lower())
+            if uuid is not None:
+                self._characteristics[uuid] = characteristic
+
+    def _characteristic(self, uuid: UUID) -> Union[BleakGATTCharacteristic, UUID]:
+        """Return the cached characteristic, falling back to the UUID if it wasn't found."""
+        return self._characteristics.get(uuid, uuid)
+
+    async def _read(self, uuid: UUID) -> bytearray:
+        """Read a characteristic from the mug."""
+        return await self.client.read_gatt_char(self._characteristic(uuid))
+
+    async def _read_changed(self, uuid: UUID) -> Optional[bytearray]:
+        """Read a characteristic, returning None if it hasn't changed since the last read."""
+        data = await self._read(uuid)
+        if self._raw_values.get(uuid) == data:
+            return None
+        self._raw_values[uuid] = data
+        self._attributes = None
+        return data
+
+    async def _write(self, uuid: UUID, data: Union[bytes, bytearray]) -> None:
+        """Write to a characteristic on the mug."""
+        await self.client.write_gatt_char(self._characteristic(uuid), data, False)
 
     async def connect(self) -> None:
-        """Try 10 times to connect and if we fail wait five minutes and try again. If connected also subscribe to state notifications."""
-        connected = False
-        for i in range(1, 10 + 1):
+        """Connect, backing off exponentially between attempts. Mark unavailable after 10 tries. If connected also subscribe to state notifications."""
+        delay = CONNECT_RETRY_DELAY
+        attempt = 0
+        while True:
+            attempt += 1
             try:
                 await self.client.connect()
                 await self.client.pair()
-                connected = True
-                _LOGGER.info(f"Connected to {self.mac_address}")
+                _LOGGER.info("Connected to %s", self.mac_address)
                 break
             except BleakError as e:
-                _LOGGER.error(f"Init: {e} on attempt {i}. waiting 30sec")
-                asyncio.sleep(30)
-
-        if connected is False:
-            self.available = False
-            self.async_update_callback()
-            _LOGGER.warning(
-                f"Failed to connect to {self.mac_address} after 10 tries. Will try again in 2min"
-            )
-            await asyncio.sleep(2 * 60)
-            return await self.connect()
+                _LOGGER.error(
+                    "Init: %s on attempt %s. waiting %ssec", e, attempt, delay
+                )
+            if attempt == 10:
+                self.available = False
+                self.async_update_callback()
+                _LOGGER.warning(
+                    "Failed to connect to %s after 10 tries. Will keep trying",
+                    self.mac_address,
+                )
+            await asyncio.sleep(delay)
+            if not self._loop:
+                return  # Stopped while waiting to retry
+            delay = min(delay * 2, CONNECT_RETRY_MAX_DELAY)
 
         self.available = True
+        self._cache_characteristics()
 
         if self.serial_number is None:
             try:
-                full_mug_id = await self.client.read_gatt_char(UUID_MUG_ID)
+                full_mug_id = await self._read(UUID_MUG_ID)
                 self.mug_id = decode_byte_string(full_mug_id[:6])
                 self.serial_number = full_mug_id[7:].decode("utf8")
+                self._attributes = None
             except Exception as e:
-                _LOGGER.warning(f"Failed to get mug ID {e}")
+                _LOGGER.warning("Failed to get mug ID %s", e)
 
         try:
             _LOGGER.info("Try to subscribe to Push Events")
-            await self.client.start_notify(UUID_PUSH_EVENT, self.push_notify)
+            await self.client.start_notify(
+                self._characteristic(UUID_PUSH_EVENT), self.push_notify
+            )
         except Exception as e:
-            _LOGGER.warning(f"Failed to subscribe to state attr {e}")
+            _LOGGER.warning("Failed to subscribe to state attr %s", e)
 
     async def update_queued_attributes(self) -> None:
         """Update all attributes in queue."""
         if not self.updates_queued:
             return
-        _LOGGER.debug(f"Queued updates {self.updates_queued}")
-        queued_attributes = set(self.updates_queued)
-        self.updates_queued.clear()
+        _LOGGER.debug("Queued updates %s", self.updates_queued)
+        queued_attributes = set()
+        while self.updates_queued:
+            queued_attributes.add(self.updates_queued.popleft())
         for attr in queued_attributes:
-            await getattr(self, f"update_{attr}")()
+            await self._update_methods[attr]()
         self.async_update_callback()
 
     def push_notify(self, sender: int, data: bytearray):
@@ -300,55 +499,35 @@ class EmberMug:
         event_id = data[0]
         if self.latest_event_id == event_id:
             return  # Skip to avoid unnecessary calls
-        _LOGGER.info(f"Push event received from Mug ({event_id})")
+        _LOGGER.debug("Push event received from Mug (%s)", event_id)
         self.latest_event_id = event_id
+        self._attributes = None
 
         # Check known IDs
-        if event_id in PUSH_EVENT_BATTERY_IDS:
+        attr = PUSH_EVENT_ATTRIBUTES.get(event_id)
+        if attr is not None:
+            self.updates_queued.append(attr)
+        elif event_id in PUSH_EVENT_BATTERY_IDS:
             # 1, 2 and 3 : Battery Change
-            if event_id in [
-                PUSH_EVENT_ID_CHARGER_CONNECTED,
-                PUSH_EVENT_ID_CHARGER_DISCONNECTED,
-            ]:
+            if event_id != PUSH_EVENT_ID_BATTERY_CHANGED:
                 # 2 -> Placed on charger, 3 -> Removed from charger
                 self.on_charging_base = event_id == PUSH_EVENT_ID_CHARGER_CONNECTED
             # All indicate changes in battery
-            self.updates_queued.add("battery")
-        elif event_id == PUSH_EVENT_ID_TARGET_TEMPERATURE_CHANGED:
-            self.updates_queued.add("target_temp")
-        elif event_id == PUSH_EVENT_ID_DRINK_TEMPERATURE_CHANGED:
-            self.updates_queued.add("current_temp")
+            self.updates_queued.append("battery")
         elif event_id == PUSH_EVENT_ID_AUTH_INFO_NOT_FOUND:
             _LOGGER.warning("Auth info missing")
-        elif event_id == PUSH_EVENT_ID_LIQUID_LEVEL_CHANGED:
-            self.updates_queued.add("liquid_level")
-        elif event_id == PUSH_EVENT_ID_LIQUID_STATE_CHANGED:
-            self.updates_queued.add("liquid_state")
-        elif event_id == PUSH_EVENT_ID_BATTERY_VOLTAGE_STATE_CHANGED:
-            self.updates_queued.add("battery_voltage")
+        # Wake up `wait_for_notifications`
+        self._updates_event.set()
 
     async def update_all(self) -> bool:
         """Update all attributes."""
-        update_attrs = [
-            "led_colour",
-            "current_temp",
-            "target_temp",
-            "temperature_unit",
-            "battery",
-            "liquid_level",
-            "liquid_state",
-            "mug_name",
-            "udsk",
-            "dsk",
-            "date_time_zone",
-            "battery_voltage",
-            "firmware_info",
-        ]
         try:
             if not self.client.is_connected:
                 await self.connect()
-            for attr in update_attrs:
-                await getattr(self, f"update_{attr}")()
+            for attr, update in self._update_methods.items():
+                if attr in STATIC_ATTRS and getattr(self, attr):
+                    continue  # Never changes, so only read it once
+                await update()
             success = True
         except BleakError as e:
             _LOGGER.error(str(e))
@@ -358,7 +537,7 @@ class EmberMug:
     async def disconnect(self) -> None:
         """Stop Loop and disconnect."""
         with contextlib.suppress(BleakError):
-            await self.client.stop_notify(UUID_PUSH_EVENT)
+            await self.client.stop_notify(self._characteristic(UUID_PUSH_EVENT))
 
         self._loop = False
         with contextlib.suppress(BleakError):
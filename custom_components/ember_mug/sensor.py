@@ -1,11 +1,10 @@
 """Sensor Entity for Ember Mug."""
 from __future__ import annotations
 
-from typing import Callable, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Union
 
 from homeassistant.components.sensor import PLATFORM_SCHEMA
 from homeassistant.const import (
-    ATTR_BATTERY_LEVEL,
     CONF_MAC,
     CONF_NAME,
     CONF_TEMPERATURE_UNIT,
@@ -32,13 +31,22 @@ from .const import (
     ICON_DEFAULT,
     ICON_EMPTY,
     MAC_ADDRESS_REGEX,
-    MUG_NAME_REGEX,
+    MUG_NAME_PATTERN,
     SERVICE_SET_LED_COLOUR,
     SERVICE_SET_MUG_NAME,
     SERVICE_SET_TARGET_TEMP,
 )
 from .mug import EmberMug
 
+
+def valid_mug_name(value: Any) -> str:
+    """Validate the whole value is a name the mug accepts."""
+    value = cv.string(value)
+    if not MUG_NAME_PATTERN.fullmatch(value):
+        raise vol.Invalid(f"Invalid mug name: '{value}'")
+    return value
+
+
 # Schema
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
@@ -59,7 +67,7 @@ SET_TARGET_TEMP_SCHEMA = {
 }
 
 SET_MUG_NAME_SCHEMA = {
-    vol.Required(ATTR_MUG_NAME): cv.matches_regex(MUG_NAME_REGEX),
+    vol.Required(ATTR_MUG_NAME): valid_mug_name,
 }
 
 
@@ -137,26 +145,7 @@ class EmberMugSensor(Entity):
     @property
     def state_attributes(self) -> Dict[str, Union[str, float]]:
         """Return a list of attributes."""
-        return {
-            ATTR_BATTERY_LEVEL: self.mug.battery,
-            "led_colour": self.mug.colour,
-            "current_temp": self.mug.current_temp,
-            "target_temp": self.mug.target_temp,
-            CONF_TEMPERATURE_UNIT: self.mug.temperature_unit,
-            "latest_push": self.mug.latest_event_id,
-            "serial_number": self.mug.serial_number,
-            "on_charging_base": self.mug.on_charging_base,
-            "liquid_level": self.mug.liquid_level,
-            "liquid_state": self.mug.liquid_state_label,
-            "liquid_state_label": self.mug.liquid_state_label,
-            "date_time_zone": self.mug.date_time_zone,
-            "battery_voltage": self.mug.battery_voltage,
-            "firmware_info": self.mug.firmware_info,
-            "udsk": self.mug.udsk,
-            "dsk": self.mug.dsk,
-            "mug_name": self.mug.mug_name,
-            "mug_id": self.mug.mug_id,
-        }
+        return self.mug.to_dict()
 
     @property
     def unit_of_measurement(self) -> str:
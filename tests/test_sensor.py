@@ -0,0 +1,32 @@
+"""Test sensor schemas and mug writes."""
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+import voluptuous as vol
+
+from custom_components.ember_mug.const import UUID_TARGET_TEMPERATURE
+from custom_components.ember_mug.mug import EmberMug
+from custom_components.ember_mug.sensor import valid_mug_name
+
+
+def test_valid_mug_name():
+    """Test names the mug accepts pass validation."""
+    assert valid_mug_name("Kitchen Mug #1") == "Kitchen Mug #1"
+    assert valid_mug_name("A" * 16) == "A" * 16
+
+
+@pytest.mark.parametrize("name", ["A" * 17, "Mug/Name", ""])
+def test_invalid_mug_name(name):
+    """Test names that are too long or use disallowed characters are rejected."""
+    with pytest.raises(vol.Invalid):
+        valid_mug_name(name)
+
+
+async def test_set_target_temp_payload(hass):
+    """Test target temp is rounded to 0.01° rather than truncated (55.41 used to send 5540)."""
+    mug = EmberMug("AA:BB:CC:DD:EE:FF", True, Mock(), hass)
+    mug.client = AsyncMock()
+    await mug.set_target_temp(55.41)
+    mug.client.write_gatt_char.assert_awaited_once_with(
+        UUID_TARGET_TEMPERATURE, b"\xa5\x15", False
+    )